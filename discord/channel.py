@@ -1176,7 +1176,7 @@ class GroupChannel(discord.abc.Messageable, Hashable):
         if owner_id == self.me.id:
             self.owner = self.me
         else:
-            self.owner = utils.find(lambda u: u.id == owner_id, self.recipients)
+            self.owner = utils.get(self.recipients, id=owner_id)
 
     async def _get_channel(self):
         return self
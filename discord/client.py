@@ -387,11 +387,10 @@ class Client:
                 for idx in reversed(removed):
                     del listeners[idx]
 
-        try:
-            coro = getattr(self, method)
-        except AttributeError:
-            pass
-        else:
+        # Most events have no handler; the getattr default avoids raising
+        # and catching an AttributeError for every one of those.
+        coro = getattr(self, method, None)
+        if coro is not None:
             self._schedule_event(coro, method, *args, **kwargs)
 
     async def on_error(self, event_method, *args, **kwargs):
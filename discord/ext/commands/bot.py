@@ -130,7 +130,7 @@ class BotBase(GroupMixin):
     def dispatch(self, event_name, *args, **kwargs):
         super().dispatch(event_name, *args, **kwargs)
         ev = 'on_' + event_name
-        for event in self.extra_events.get(ev, []):
+        for event in self.extra_events.get(ev, ()):
             self._schedule_event(event, ev, *args, **kwargs)
 
     async def close(self):
@@ -25,7 +25,6 @@ DEALINGS IN THE SOFTWARE.
 """
 
 import asyncio
-import json
 import logging
 import sys
 from urllib.parse import quote as _uriquote
@@ -43,7 +42,7 @@ async def json_or_text(response):
     text = await response.text(encoding='utf-8')
     try:
         if response.headers['content-type'] == 'application/json':
-            return json.loads(text)
+            return utils.from_json(text)
     except KeyError:
         # Thanks Cloudflare
         pass
@@ -112,9 +111,18 @@ class HTTPClient:
         user_agent = 'DiscordBot (https://github.com/Rapptz/discord.py {0}) Python/{1[0]}.{1[1]} aiohttp/{2}'
         self.user_agent = user_agent.format(__version__, sys.version_info, aiohttp.__version__)
 
+    def _create_session(self):
+        connector = self.connector
+        if connector is None:
+            # Every request goes to the same host, so the resolved address
+            # can be cached far longer than aiohttp's 10 second default.
+            connector = aiohttp.TCPConnector(ttl_dns_cache=300)
+
+        return aiohttp.ClientSession(connector=connector, ws_response_class=DiscordClientWebSocketResponse)
+
     def recreate(self):
         if self.__session.closed:
-            self.__session = aiohttp.ClientSession(connector=self.connector, ws_response_class=DiscordClientWebSocketResponse)
+            self.__session = self._create_session()
 
     async def ws_connect(self, url, *, compress=0):
         kwargs = {
@@ -153,7 +161,7 @@ class HTTPClient:
         # some checking if it's a JSON request
         if 'json' in kwargs:
             headers['Content-Type'] = 'application/json'
-            kwargs['data'] = utils.to_json(kwargs.pop('json'))
+            kwargs['data'] = utils._to_json_bytes(kwargs.pop('json'))
 
         try:
             reason = kwargs.pop('reason')
@@ -285,7 +293,7 @@ class HTTPClient:
 
     async def static_login(self, token, *, bot):
         # Necessary to get aiohttp to stop complaining about session creation
-        self.__session = aiohttp.ClientSession(connector=self.connector, ws_response_class=DiscordClientWebSocketResponse)
+        self.__session = self._create_session()
         old_token, old_bot = self.token, self.bot_token
         self._token(token, bot=bot)
 
@@ -53,6 +53,10 @@ __all__ = (
     'DeletedReferencedMessage',
 )
 
+_USER_MENTION_REGEX = re.compile(r'<@!?([0-9]+)>')
+_CHANNEL_MENTION_REGEX = re.compile(r'<#([0-9]+)>')
+_ROLE_MENTION_REGEX = re.compile(r'<@&([0-9]+)>')
+
 def convert_emoji_reaction(emoji):
     if isinstance(emoji, Reaction):
         emoji = emoji.emoji
@@ -548,7 +552,7 @@ class Message(Hashable):
                 setattr(self, key, transform(value))
 
     def _add_reaction(self, data, emoji, user_id):
-        reaction = utils.find(lambda r: r.emoji == emoji, self.reactions)
+        reaction = utils.get(self.reactions, emoji=emoji)
         is_me = data['me'] = user_id == self._state.self_id
 
         if reaction is None:
@@ -562,7 +566,7 @@ class Message(Hashable):
         return reaction
 
     def _remove_reaction(self, data, emoji, user_id):
-        reaction = utils.find(lambda r: r.emoji == emoji, self.reactions)
+        reaction = utils.get(self.reactions, emoji=emoji)
 
         if reaction is None:
             # already removed?
@@ -708,7 +712,7 @@ class Message(Hashable):
             if uid == self.author.id:
                 participants.append(self.author)
             else:
-                user = utils.find(lambda u: u.id == uid, self.mentions)
+                user = utils.get(self.mentions, id=uid)
                 if user is not None:
                     participants.append(user)
 
@@ -736,21 +740,21 @@ class Message(Hashable):
         This allows you to receive the user IDs of mentioned users
         even in a private message context.
         """
-        return [int(x) for x in re.findall(r'<@!?([0-9]+)>', self.content)]
+        return [int(x) for x in _USER_MENTION_REGEX.findall(self.content)]
 
     @utils.cached_slot_property('_cs_raw_channel_mentions')
     def raw_channel_mentions(self):
         """List[:class:`int`]: A property that returns an array of channel IDs matched with
         the syntax of ``<#channel_id>`` in the message content.
         """
-        return [int(x) for x in re.findall(r'<#([0-9]+)>', self.content)]
+        return [int(x) for x in _CHANNEL_MENTION_REGEX.findall(self.content)]
 
     @utils.cached_slot_property('_cs_raw_role_mentions')
     def raw_role_mentions(self):
         """List[:class:`int`]: A property that returns an array of role IDs matched with
         the syntax of ``<@&role_id>`` in the message content.
         """
-        return [int(x) for x in re.findall(r'<@&([0-9]+)>', self.content)]
+        return [int(x) for x in _ROLE_MENTION_REGEX.findall(self.content)]
 
     @utils.cached_slot_property('_cs_channel_mentions')
     def channel_mentions(self):
@@ -334,7 +334,11 @@ class ConnectionState:
             return value
 
     def _get_private_channel_by_user(self, user_id):
-        return self._private_channels_by_user.get(user_id)
+        value = self._private_channels_by_user.get(user_id)
+        if value is not None:
+            # keep the LRU ordering consistent with lookups by channel ID
+            self._private_channels.move_to_end(value.id)
+        return value
 
     def _add_private_channel(self, channel):
         channel_id = channel.id
@@ -359,7 +363,7 @@ class ConnectionState:
             self._private_channels_by_user.pop(channel.recipient.id, None)
 
     def _get_message(self, msg_id):
-        return utils.find(lambda m: m.id == msg_id, reversed(self._messages)) if self._messages else None
+        return utils.get(reversed(self._messages), id=msg_id) if self._messages else None
 
     def _add_guild_from_data(self, guild):
         guild = Guild(data=guild, state=self)
@@ -1039,7 +1043,7 @@ class ConnectionState:
             elif isinstance(channel, TextChannel) and guild is not None:
                 member = guild.get_member(user_id)
             elif isinstance(channel, GroupChannel):
-                member = utils.find(lambda x: x.id == user_id, channel.recipients)
+                member = utils.get(channel.recipients, id=user_id)
 
             if member is not None:
                 timestamp = datetime.datetime.utcfromtimestamp(data.get('timestamp'))
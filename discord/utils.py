@@ -40,6 +40,12 @@ import warnings
 
 from .errors import InvalidArgument
 
+try:
+    import orjson
+    has_orjson = True
+except ImportError:
+    has_orjson = False
+
 DISCORD_EPOCH = 1420070400000
 MAX_ASYNCIO_SECONDS = 3456000
 
@@ -312,8 +318,20 @@ def _bytes_to_base64_data(data):
     b64 = b64encode(data).decode('ascii')
     return fmt.format(mime=mime, data=b64)
 
+_JSON_ENCODER = json.JSONEncoder(separators=(',', ':'), ensure_ascii=True)
+
 def to_json(obj):
-    return json.dumps(obj, separators=(',', ':'), ensure_ascii=True)
+    # json.dumps builds a new JSONEncoder on every call when given options
+    return _JSON_ENCODER.encode(obj)
+
+if has_orjson:
+    from_json = orjson.loads
+    _to_json_bytes = orjson.dumps
+else:
+    from_json = json.loads
+
+    def _to_json_bytes(obj):
+        return to_json(obj).encode('utf-8')
 
 def _parse_ratelimit_header(request, *, use_clock=False):
     reset_after = request.headers.get('X-Ratelimit-Reset-After')
@@ -425,6 +443,9 @@ def _string_width(string, *, _IS_ASCII=_IS_ASCII):
         width += 2 if func(char) in UNICODE_WIDE_CHAR_TYPE else 1
     return width
 
+_INVITE_URL_REGEX = re.compile(r'(?:https?\:\/\/)?discord(?:\.gg|(?:app)?\.com\/invite)\/(.+)')
+_TEMPLATE_URL_REGEX = re.compile(r'(?:https?\:\/\/)?discord(?:\.new|(?:app)?\.com\/template)\/(.+)')
+
 def resolve_invite(invite):
     """
     Resolves an invite from a :class:`~discord.Invite`, URL or code.
@@ -443,8 +464,7 @@ def resolve_invite(invite):
     if isinstance(invite, Invite):
         return invite.code
     else:
-        rx = r'(?:https?\:\/\/)?discord(?:\.gg|(?:app)?\.com\/invite)\/(.+)'
-        m = re.match(rx, invite)
+        m = _INVITE_URL_REGEX.match(invite)
         if m:
             return m.group(1)
     return invite
@@ -469,8 +489,7 @@ def resolve_template(code):
     if isinstance(code, Template):
         return code.code
     else:
-        rx = r'(?:https?\:\/\/)?discord(?:\.new|(?:app)?\.com\/template)\/(.+)'
-        m = re.match(rx, code)
+        m = _TEMPLATE_URL_REGEX.match(code)
         if m:
             return m.group(1)
     return code
@@ -524,6 +543,8 @@ def escape_markdown(text, *, as_needed=False, ignore_links=True):
         text = re.sub(r'\\', r'\\\\', text)
         return _MARKDOWN_ESCAPE_REGEX.sub(r'\\\1', text)
 
+_MENTION_ESCAPE_REGEX = re.compile(r'@(everyone|here|[!&]?[0-9]{17,21})')
+
 def escape_mentions(text):
     """A helper function that escapes everyone, here, role, and user mentions.
 
@@ -547,4 +568,4 @@ def escape_mentions(text):
     :class:`str`
         The text with the mentions removed.
     """
-    return re.sub(r'@(everyone|here|[!&]?[0-9]{17,21})', '@\u200b\\1', text)
+    return _MENTION_ESCAPE_REGEX.sub('@\u200b\\1', text)
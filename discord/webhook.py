@@ -26,7 +26,6 @@ DEALINGS IN THE SOFTWARE.
 
 import logging
 import asyncio
-import json
 import time
 import re
 from urllib.parse import quote as _uriquote
@@ -198,7 +197,7 @@ class AsyncWebhookAdapter(WebhookAdapter):
         files = files or []
         if payload:
             headers['Content-Type'] = 'application/json'
-            data = utils.to_json(payload)
+            data = utils._to_json_bytes(payload)
 
         if reason:
             headers['X-Audit-Log-Reason'] = _uriquote(reason, safe='/ ')
@@ -222,7 +221,7 @@ class AsyncWebhookAdapter(WebhookAdapter):
                 # Coerce empty strings to return None for hygiene purposes
                 response = (await r.text(encoding='utf-8')) or None
                 if r.headers['Content-Type'] == 'application/json':
-                    response = json.loads(response)
+                    response = utils.from_json(response)
 
                 # check if we have rate limit header information
                 remaining = r.headers.get('X-Ratelimit-Remaining')
@@ -300,7 +299,7 @@ class RequestsWebhookAdapter(WebhookAdapter):
         files = files or []
         if payload:
             headers['Content-Type'] = 'application/json'
-            data = utils.to_json(payload)
+            data = utils._to_json_bytes(payload)
 
         if reason:
             headers['X-Audit-Log-Reason'] = _uriquote(reason, safe='/ ')
@@ -324,7 +323,7 @@ class RequestsWebhookAdapter(WebhookAdapter):
 
             log.debug('Webhook ID %s with %s %s has returned status code %s', _id, verb, base_url, r.status)
             if r.headers['Content-Type'] == 'application/json':
-                response = json.loads(response)
+                response = utils.from_json(response)
 
             # check if we have rate limit header information
             remaining = r.headers.get('X-Ratelimit-Remaining')
@@ -35,6 +35,7 @@ with open('README.rst') as f:
 
 extras_require = {
     'voice': ['PyNaCl>=1.3.0,<1.5'],
+    'speed': ['orjson>=3.5.4'],
     'docs': [
         'sphinx==1.8.5',
         'sphinxcontrib_trio==1.1.1',